@@ -1,5 +1,6 @@
 import numpy as np
 from vedo import Cone, Sphere, merge, Volume, dataurl, utils
+from vedo import LinearTransform, LinearTransformNP
 import vtk
 
 print('\n\n---------------------------------')
@@ -349,6 +350,50 @@ q = transformations.cyl2cart(*q)
 print("cart2spher spher2cyl cyl2cart", q)
 assert np.allclose(q, [5,2,3])
 
+###################################### transform many points at once
+LT = LinearTransform().rotate_z(30).scale([1,2,3]).translate([1,2,3])
+q = np.random.rand(10, 3)
+qt = LT.transform_points(q)
+print("transform_points", qt[0])
+assert np.allclose(qt, [LT.transform_point(p) for p in q], atol=1e-5)
+assert np.allclose(LT.move(q), qt)
+q2 = np.random.rand(10, 2)
+assert np.allclose(LT.transform_points(q2), [LT.transform_point(p) for p in q2], atol=1e-5)
+M = np.eye(4)
+M[3] = [0.1, 0.2, 0.3, 1]  # projective, last row is ignored by vtk
+LT = LinearTransform(M)
+assert np.allclose(LT.transform_points(q), [LT.transform_point(p) for p in q], atol=1e-5)
+
+###################################### numpy backend of LinearTransform
+LT = LinearTransform().translate([1,2,3]).rotate_z(30).scale(2)
+LT.rotate(40, axis=(1,1,0), point=(1,0,0))
+LTNP = LinearTransformNP().translate([1,2,3]).rotate_z(30).scale(2)
+LTNP.rotate(40, axis=(1,1,0), point=(1,0,0))
+print("LinearTransformNP", LTNP.matrix)
+assert np.allclose(LT.matrix, LTNP.matrix)
+assert np.allclose(LT.orientation, LTNP.orientation)
+assert np.allclose(LT.get_scale(), LTNP.get_scale())
+q = np.random.rand(10, 3)
+assert np.allclose(LT.transform_points(q), LTNP.transform_points(q))
+
+M = np.eye(4)
+M[:3, :3] = [[1, 0.5, 0], [0.2, 1, 0], [0, 0.3, 1]]  # with shear
+print("LinearTransformNP sheared scale", LinearTransformNP(M).get_scale())
+assert np.allclose(LinearTransform(M).get_scale(), LinearTransformNP(M).get_scale())
+
+LT.reorient([0,0,1], [1,2,3], around=(1,0,0), rotation=20)
+LTNP.reorient([0,0,1], [1,2,3], around=(1,0,0), rotation=20)
+print("LinearTransformNP reorient", LTNP.orientation)
+assert np.allclose(LT.matrix, LTNP.matrix)
+
+vol1 = Volume(np.zeros((10, 10, 10)))
+vol2 = vol1.clone()
+LinearTransform().translate([1,2,3]).move(vol1)
+LinearTransformNP().translate([1,2,3]).move(vol2)
+print("LinearTransformNP on Volume", vol2.origin())
+assert np.allclose(vol1.origin(), vol2.origin())
+assert np.allclose(vol2.origin(), [1,2,3])
+
 ######################################
 print("OK with test_actors")
 
@@ -9,7 +9,7 @@ import vedo.vtkclasses as vtki
 import vedo
 from vedo import colors
 from vedo import utils
-from vedo.transformations import LinearTransform, NonLinearTransform
+from vedo.transformations import LinearTransform, LinearTransformNP, NonLinearTransform
 
 
 __docformat__ = "google"
@@ -1680,7 +1680,7 @@ class PointAlgorithms(CommonAlgorithms):
             if LT.is_identity():
                 return self
         
-        elif isinstance(LT, (vtki.vtkMatrix4x4, vtki.vtkLinearTransform)) or utils.is_sequence(LT):
+        elif isinstance(LT, (LinearTransformNP, vtki.vtkMatrix4x4, vtki.vtkLinearTransform)) or utils.is_sequence(LT):
             LT_is_linear = True
             LT = LinearTransform(LT)
             tr = LT.T
@@ -1712,11 +1712,15 @@ class PointAlgorithms(CommonAlgorithms):
                     self.transform = LinearTransform()
 
         ################
+        # the filter is kept on the object and reused by the next calls
+        tp = getattr(self, "_transform_filter", None)
         if isinstance(self.dataset, vtki.vtkPolyData):
-            tp = vtki.new("TransformPolyDataFilter")
+            if tp is None or not tp.IsA("vtkTransformPolyDataFilter"):
+                tp = vtki.new("TransformPolyDataFilter")
         elif isinstance(self.dataset, vtki.vtkUnstructuredGrid):
-            tp = vtki.new("TransformFilter")
-            tp.TransformAllInputVectorsOn()
+            if tp is None or not tp.IsA("vtkTransformFilter"):
+                tp = vtki.new("TransformFilter")
+                tp.TransformAllInputVectorsOn()
         # elif isinstance(self.dataset, vtki.vtkImageData):
         #     tp = vtki.new("ImageReslice")
         #     tp.SetInterpolationModeToCubic()
@@ -1734,6 +1738,11 @@ class PointAlgorithms(CommonAlgorithms):
             self.dataset.DeepCopy(out)
         else:
             self.dataset.ShallowCopy(out)
+        # do not keep the old data nor the transformation alive in the filter
+        out.Initialize()
+        tp.RemoveAllInputs()
+        tp.SetTransform(None)
+        self._transform_filter = tp
 
         # reset the locators
         self.point_locator = None
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import math
 from typing import List
 from typing_extensions import Self
 import numpy as np
@@ -16,6 +17,7 @@ Submodule to work with linear and non-linear transformations<br>
 
 __all__ = [
     "LinearTransform",
+    "LinearTransformNP",
     "NonLinearTransform",
     "TransformInterpolator",
     "spher2cart",
@@ -28,8 +30,18 @@ __all__ = [
     "pol2cart",
 ]
 
+_AXES = {"x": (1.0, 0.0, 0.0), "y": (0.0, 1.0, 0.0), "z": (0.0, 0.0, 1.0)}
+
+_IDENTITY16 = np.array(
+    [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1], dtype=np.float64
+)
+_IDENTITY16_BYTES = _IDENTITY16.tobytes()
+
 ###################################################
 def _is_sequence(arg):
+    # fast path for the common containers, avoids the hasattr() lookups
+    if isinstance(arg, (list, tuple, np.ndarray)):
+        return True
     if hasattr(arg, "strip"):
         return False
     if hasattr(arg, "__getslice__"):
@@ -39,6 +51,160 @@ def _is_sequence(arg):
     return False
 
 
+def _get_matrix_buffer(m) -> np.ndarray:
+    # copy the 16 elements of a vtkMatrix4x4 in one call (row-major)
+    buf = np.empty(16, dtype=np.float64)
+    m.DeepCopy(buf, m)
+    return buf
+
+
+def _to_matrix_buffer(M) -> np.ndarray:
+    # flatten a 4x4 or 3x3 matrix into a contiguous row-major buffer of 16
+    arr = np.asarray(M, dtype=np.float64)
+    if arr.shape != (4, 4):
+        n = len(arr)
+        arr4 = np.eye(4)
+        arr4[:n, :n] = arr
+        arr = arr4
+    return np.ascontiguousarray(arr).ravel()
+
+
+def _rotate_vector(v, anglerad, ax, ay, az) -> tuple:
+    # rotate vector v by anglerad around the unit axis (ax, ay, az)
+    # with the quaternion sandwich v' = v + w*t + u x t, where t = 2 u x v
+    # and (w, u) = (cos(angle/2), axis*sin(angle/2)).
+    # All the arithmetic is done on python floats: at this size
+    # numpy temporaries cost far more than the math itself.
+    w = math.cos(anglerad / 2)
+    s = math.sin(anglerad / 2)
+    ux, uy, uz = ax * s, ay * s, az * s
+    vx, vy, vz = v
+    tx = 2 * (uy * vz - uz * vy)
+    ty = 2 * (uz * vx - ux * vz)
+    tz = 2 * (ux * vy - uy * vx)
+    return (
+        vx + w * tx + uy * tz - uz * ty,
+        vy + w * ty + uz * tx - ux * tz,
+        vz + w * tz + ux * ty - uy * tx,
+    )
+
+
+def _rotation_matrix(anglerad, ax, ay, az) -> np.ndarray:
+    # 3x3 matrix of a right-handed rotation of anglerad around the unit axis
+    c = math.cos(anglerad)
+    s = math.sin(anglerad)
+    t = 1 - c
+    # filling a preallocated array skips the nested-sequence parsing
+    R = np.empty((3, 3), dtype=np.float64)
+    R.flat = (
+        t * ax * ax + c, t * ax * ay - s * az, t * ax * az + s * ay,
+        t * ax * ay + s * az, t * ay * ay + c, t * ay * az - s * ax,
+        t * ax * az - s * ay, t * ay * az + s * ax, t * az * az + c,
+    )
+    return R
+
+
+def _affine_about(M3, center) -> np.ndarray:
+    # 4x4 matrix applying the 3x3 matrix M3 around the point center
+    A = np.eye(4)
+    A[:3, :3] = M3
+    A[:3, 3] = center - M3 @ center
+    return A
+
+
+def _transform_points(M, pts) -> np.ndarray:
+    # apply the 4x4 matrix M to an array of points of shape (N,3) or (N,2)
+    pts = np.ascontiguousarray(pts, dtype=np.float64)
+    if pts.shape[1] == 2:
+        pts = np.c_[pts, np.zeros(len(pts))]
+    # as in vtkLinearTransform, the last row of the matrix is ignored
+    return pts @ M[:3, :3].T + M[:3, 3]
+
+
+def _det3(m) -> float:
+    # determinant of the upper-left 3x3 block of the flat row-major 4x4 list m
+    return (
+        m[0] * (m[5] * m[10] - m[6] * m[9])
+        - m[1] * (m[4] * m[10] - m[6] * m[8])
+        + m[2] * (m[4] * m[9] - m[5] * m[8])
+    )
+
+
+def _scale_from_matrix(m):
+    # Scale factors as computed by vtkTransform.GetScale(), from the flat
+    # row-major list m of the 16 matrix elements, when the columns of the
+    # 3x3 block are orthogonal (i.e. rotations combined with scaling):
+    # these are the column norms, negated if the matrix has a reflection.
+    # Returns None for more general matrices, e.g. with shear.
+    # Python floats are used as at this size numpy only adds overhead.
+    s0 = m[0] * m[0] + m[4] * m[4] + m[8] * m[8]
+    s1 = m[1] * m[1] + m[5] * m[5] + m[9] * m[9]
+    s2 = m[2] * m[2] + m[6] * m[6] + m[10] * m[10]
+    d01 = m[0] * m[1] + m[4] * m[5] + m[8] * m[9]
+    d02 = m[0] * m[2] + m[4] * m[6] + m[8] * m[10]
+    d12 = m[1] * m[2] + m[5] * m[6] + m[9] * m[10]
+    tol = 1e-12 * max(s0, s1, s2)
+    if abs(d01) > tol or abs(d02) > tol or abs(d12) > tol:
+        return None
+    sign = -1.0 if _det3(m) < 0 else 1.0
+    return np.array([sign * math.sqrt(s0), sign * math.sqrt(s1), sign * math.sqrt(s2)])
+
+
+def _orientation_from_matrix(m) -> np.ndarray:
+    # Euler angles in degrees, with the same convention and algorithm
+    # as vtkTransform.GetOrientation() (rotations about y, then x, then z),
+    # from the flat row-major list m of the 16 matrix elements.
+    ortho = [[m[0], m[1], m[2]], [m[4], m[5], m[6]], [m[8], m[9], m[10]]]
+    if _det3(m) < 0:
+        for row in ortho:
+            row[2] = -row[2]
+
+    s = _scale_from_matrix(m)
+    if s is not None and s.all():
+        # rotation combined with scaling: the closest orthogonal
+        # matrix is obtained by normalizing the columns
+        n = np.abs(s).tolist()
+        ortho = [[row[0] / n[0], row[1] / n[1], row[2] / n[2]] for row in ortho]
+    else:
+        # closest orthogonal matrix (polar decomposition)
+        u, _, vt = np.linalg.svd(ortho)
+        ortho = (u @ vt).tolist()
+
+    x2, y2, z2 = ortho[2]
+    x3, y3, z3 = ortho[1]
+    eps = 0.001
+
+    # first rotate about y axis
+    d1 = math.sqrt(x2 * x2 + z2 * z2)
+    if d1 < eps:
+        cos_theta, sin_theta = 1.0, 0.0
+    else:
+        cos_theta, sin_theta = z2 / d1, x2 / d1
+    theta = math.atan2(sin_theta, cos_theta)
+
+    # now rotate about x axis
+    d = math.sqrt(x2 * x2 + y2 * y2 + z2 * z2)
+    if d < eps:
+        sin_phi, cos_phi = 0.0, 1.0
+    elif d1 < eps:
+        sin_phi, cos_phi = y2 / d, z2 / d
+    else:
+        sin_phi, cos_phi = y2 / d, (x2 * x2 + z2 * z2) / (d1 * d)
+    phi = math.atan2(sin_phi, cos_phi)
+
+    # finally, rotate about z
+    x3p = x3 * cos_theta - z3 * sin_theta
+    y3p = -sin_phi * sin_theta * x3 + cos_phi * y3 - sin_phi * cos_theta * z3
+    d2 = math.sqrt(x3p * x3p + y3p * y3p)
+    if d2 < eps:
+        cos_alpha, sin_alpha = 1.0, 0.0
+    else:
+        cos_alpha, sin_alpha = y3p / d2, x3p / d2
+    alpha = math.atan2(sin_alpha, cos_alpha)
+
+    return np.array([math.degrees(phi), -math.degrees(theta), math.degrees(alpha)])
+
+
 ###################################################
 class LinearTransform:
     """Work with linear transformations."""
@@ -88,12 +254,7 @@ class LinearTransform:
 
         elif _is_sequence(T):
             S = vtki.vtkTransform()
-            M = vtki.vtkMatrix4x4()
-            n = len(T)
-            for i in range(n):
-                for j in range(n):
-                    M.SetElement(i, j, T[i][j])
-            S.SetMatrix(M)
+            S.SetMatrix(_to_matrix_buffer(T))
             T = S
 
         elif isinstance(T, vtki.vtkLinearTransform):
@@ -106,6 +267,9 @@ class LinearTransform:
             S.DeepCopy(T.T)
             T = S
 
+        elif isinstance(T, LinearTransformNP):
+            T = T.to_vtk()
+
         elif isinstance(T, str):
             import json
             self.filename = str(T)
@@ -137,16 +301,27 @@ class LinearTransform:
                                 matrix[i, j] = float(v)
                         i += 1
             T = vtki.vtkTransform()
-            m = vtki.vtkMatrix4x4()
-            for i in range(4):
-                for j in range(4):
-                    m.SetElement(i, j, matrix[i][j])
-            T.SetMatrix(m)
+            T.SetMatrix(_to_matrix_buffer(matrix))
 
         self.T = T
         self.T.PostMultiply()
         self.inverse_flag = False
 
+        self._cached_matrix = None
+        self._cached_mtime = 0
+        self._scratch_m4 = None
+
+    def _matrix_buffer(self) -> np.ndarray:
+        # flat 16-element copy of the matrix, read again from vtk only
+        # when the transformation was modified since the last read.
+        # It is shared, so callers must not modify it in place.
+        if self._cached_matrix is None or self.T.GetMTime() != self._cached_mtime:
+            self._cached_matrix = _get_matrix_buffer(self.T.GetMatrix())
+            # turn -0.0 into 0.0 so that the buffer can be compared bytewise
+            self._cached_matrix += 0.0
+            self._cached_mtime = self.T.GetMTime()
+        return self._cached_matrix
+
     def __str__(self):
         module = self.__class__.__module__
         name = self.__class__.__name__
@@ -186,6 +361,13 @@ class LinearTransform:
             p = [p[0], p[1], 0]
         return np.array(self.T.TransformFloatPoint(p))
 
+    def transform_points(self, pts) -> np.ndarray:
+        """
+        Apply transformation to a set of points of shape (N,3) or (N,2).
+        The matrix is read once and applied to all points in a single product.
+        """
+        return _transform_points(self._matrix_buffer().reshape(4, 4), pts)
+
     def move(self, obj):
         """
         Apply transformation to object or single point.
@@ -213,6 +395,8 @@ class LinearTransform:
             ```
         """
         if _is_sequence(obj):
+            if np.ndim(obj) == 2:
+                return self.transform_points(obj)
             n = len(obj)
             if n == 2:
                 obj = [obj[0], obj[1], 0]
@@ -276,13 +460,19 @@ class LinearTransform:
         self.T.Pop()
         return self
 
-    def is_identity(self) -> bool:
-        """Check if the transformation is the identity."""
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(4)] for i in range(4)]
-        if np.allclose(M - np.eye(4), 0):
-            return True
-        return False
+    def is_identity(self, tol=None) -> bool:
+        """
+        Check if the transformation is the identity.
+
+        Arguments:
+            tol : (float)
+                if given, compare with this absolute tolerance
+                instead of requiring an exact match.
+        """
+        buf = self._matrix_buffer()
+        if tol is None:
+            return buf.tobytes() == _IDENTITY16_BYTES
+        return np.allclose(buf, _IDENTITY16, rtol=0, atol=tol)
 
     def invert(self) -> Self:
         """Invert the transformation. Acts in-place."""
@@ -298,9 +488,10 @@ class LinearTransform:
 
     def transpose(self) -> Self:
         """Transpose the transformation. Acts in-place."""
-        M = vtki.vtkMatrix4x4()
-        self.T.GetTranspose(M)
-        self.T.SetMatrix(M)
+        if self._scratch_m4 is None:
+            self._scratch_m4 = vtki.vtkMatrix4x4()
+        self.T.GetTranspose(self._scratch_m4)
+        self.T.SetMatrix(self._scratch_m4)
         return self
 
     def copy(self) -> "LinearTransform":
@@ -339,14 +530,12 @@ class LinearTransform:
             print(B*A)
             ```
         """
+        if isinstance(T, LinearTransformNP):
+            T = T.matrix
+
         if _is_sequence(T):
             S = vtki.vtkTransform()
-            M = vtki.vtkMatrix4x4()
-            n = len(T)
-            for i in range(n):
-                for j in range(n):
-                    M.SetElement(i, j, T[i][j])
-            S.SetMatrix(M)
+            S.SetMatrix(_to_matrix_buffer(T))
             T = S
 
         if pre_multiply:
@@ -384,15 +573,14 @@ class LinearTransform:
 
     def scale(self, s, origin=True) -> Self:
         """Scale."""
-        if not _is_sequence(s):
-            s = [s, s, s]
+        s = tuple(s) if _is_sequence(s) else (s, s, s)
 
         if origin is True:
-            p = np.array(self.T.GetPosition())
-            if np.linalg.norm(p) > 0:
-                self.T.Translate(-p)
+            x, y, z = self.T.GetPosition()
+            if x or y or z:
+                self.T.Translate(-x, -y, -z)
                 self.T.Scale(*s)
-                self.T.Translate(p)
+                self.T.Translate(x, y, z)
             else:
                 self.T.Scale(*s)
 
@@ -425,46 +613,40 @@ class LinearTransform:
         """
         if not angle:
             return self
-        if rad:
-            anglerad = angle
-        else:
-            anglerad = np.deg2rad(angle)
-        axis = np.asarray(axis) / np.linalg.norm(axis)
-        a = np.cos(anglerad / 2)
-        b, c, d = -axis * np.sin(anglerad / 2)
-        aa, bb, cc, dd = a * a, b * b, c * c, d * d
-        bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-        R = np.array(
-            [
-                [aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-                [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-                [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc],
-            ]
-        )
-        rv = np.dot(R, self.T.GetPosition() - np.asarray(point)) + point
+        anglerad = angle if rad else math.radians(angle)
+        # work on python floats, at size 3 numpy only adds overhead
+        ax, ay, az = [float(c) for c in axis]
+        norm = math.sqrt(ax * ax + ay * ay + az * az)
+        ax, ay, az = ax / norm, ay / norm, az / norm
+        px, py, pz = [float(c) for c in point]
+        x, y, z = self.T.GetPosition()
+        rx, ry, rz = _rotate_vector((x - px, y - py, z - pz), anglerad, ax, ay, az)
 
         if rad:
-            angle *= 180.0 / np.pi
+            angle = math.degrees(angle)
         # this vtk method only rotates in the origin of the object:
-        self.T.RotateWXYZ(angle, axis[0], axis[1], axis[2])
-        self.T.Translate(rv - np.array(self.T.GetPosition()))
+        self.T.RotateWXYZ(angle, ax, ay, az)
+        x, y, z = self.T.GetPosition()
+        self.T.Translate(rx + px - x, ry + py - y, rz + pz - z)
         return self
 
     def _rotatexyz(self, axe, angle, rad, around):
         if not angle:
             return self
         if rad:
-            angle *= 180 / np.pi
-
-        rot = dict(x=self.T.RotateX, y=self.T.RotateY, z=self.T.RotateZ)
+            angle = math.degrees(angle)
 
-        if around is None:
-            # rotate around its origin
-            rot[axe](angle)
-        else:
+        if around is not None:
             # displacement needed to bring it back to the origin
-            self.T.Translate(-np.asarray(around))
-            rot[axe](angle)
+            around = np.asarray(around, dtype=float)
+            self.T.Translate(-around)
+        if axe == "x":
+            self.T.RotateX(angle)
+        elif axe == "y":
+            self.T.RotateY(angle)
+        else:
+            self.T.RotateZ(angle)
+        if around is not None:
             self.T.Translate(around)
         return self
 
@@ -534,33 +716,22 @@ class LinearTransform:
     @property
     def matrix(self) -> np.ndarray:
         """Get the 4x4 trasformation matrix."""
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(4)] for i in range(4)]
-        return np.array(M)
+        return self._matrix_buffer().reshape(4, 4).copy()
 
     @matrix.setter
     def matrix(self, M) -> None:
         """Set trasformation by assigning a 4x4 or 3x3 numpy matrix."""
-        n = len(M)
-        m = vtki.vtkMatrix4x4()
-        for i in range(n):
-            for j in range(n):
-                m.SetElement(i, j, M[i][j])
-        self.T.SetMatrix(m)
+        self.T.SetMatrix(_to_matrix_buffer(M))
 
     @property
     def matrix3x3(self) -> np.ndarray:
         """Get the 3x3 trasformation matrix."""
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(3)] for i in range(3)]
-        return np.array(M)
+        return self.matrix[:3, :3]
 
     def write(self, filename="transform.mat") -> Self:
         """Save transformation to ASCII file."""
         import json
-        m = self.T.GetMatrix()
-        M = [[m.GetElement(i, j) for j in range(4)] for i in range(4)]
-        arr = np.array(M)
+        arr = self.matrix
         dictionary = {
             "name": self.name,
             "comment": self.comment,
@@ -617,6 +788,370 @@ class LinearTransform:
         return self
 
 
+###################################################
+class LinearTransformNP:
+    """
+    Work with linear transformations stored as a numpy 4x4 matrix.
+
+    It has the same interface as `LinearTransform` but all operations
+    are composed in numpy, without going through vtk, which makes it
+    much faster for transformation-heavy computations.
+    A vtk object is only created when the transformation is handed over
+    to vtk, e.g. with `to_vtk()` or `apply_transform()`.
+
+    Not available: the stack of concatenated transformations
+    (`pop()`, `ntransforms`, `get_concatenated_transform()`),
+    the `T` attribute and `compute_main_axes()`.
+    """
+
+    def __init__(self, T=None) -> None:
+        """
+        Define a linear transformation backed by a numpy array.
+
+        Arguments:
+            T : (str, LinearTransform, vtkTransform, vtkMatrix4x4, numpy array)
+                input transformation. Defaults to unit.
+
+        Example:
+            ```python
+            from vedo import *
+            LT = LinearTransformNP()
+            LT.translate([3,0,1]).rotate_z(45)
+            print(LT)
+
+            sph = Sphere(r=0.2)
+            sph.apply_transform(LT) # same as: LT.move(sph)
+            show(Point([0,0,0]), sph, axes=1).close()
+            ```
+        """
+        self.name = "LinearTransformNP"
+        self.filename = ""
+        self.comment = ""
+        self.inverse_flag = False
+
+        if isinstance(T, str):
+            LT = LinearTransform(T)
+            self.filename = LT.filename
+            self.comment = LT.comment
+            if LT.name != "LinearTransform":
+                self.name = LT.name
+            T = LT
+
+        self._M = _as_matrix(T)
+
+    def __str__(self):
+        module = self.__class__.__module__
+        name = self.__class__.__name__
+        s = f"\x1b[7m\x1b[1m{module}.{name} at ({hex(id(self))})".ljust(75) + "\x1b[0m"
+        s += "\nname".ljust(15) + ": " + self.name
+        if self.filename:
+            s += "\nfilename".ljust(15) + ": " + self.filename
+        if self.comment:
+            s += "\ncomment".ljust(15) + f': \x1b[3m"{self.comment}"\x1b[0m'
+        s += "\ninverse flag".ljust(15) + f": {bool(self.inverse_flag)}"
+        arr = np.array2string(self._M,
+            separator=', ', precision=6, suppress_small=True)
+        s += "\nmatrix 4x4".ljust(15) + f":\n{arr}"
+        return s
+
+    def __repr__(self):
+        return self.__str__()
+
+    def print(self) -> "LinearTransformNP":
+        """Print transformation."""
+        print(self.__str__())
+        return self
+
+    def __call__(self, obj):
+        """
+        Apply transformation to object or single point.
+        Same as `move()` except that a copy is returned.
+        """
+        return self.move(obj.copy())
+
+    def to_vtk(self) -> vtki.vtkTransform:
+        """Create a `vtkTransform` holding the current matrix."""
+        T = vtki.vtkTransform()
+        T.SetMatrix(self._M.ravel())
+        return T
+
+    def transform_point(self, p) -> np.ndarray:
+        """
+        Apply transformation to a single point.
+        """
+        return _transform_points(self._M, [p])[0]
+
+    def transform_points(self, pts) -> np.ndarray:
+        """
+        Apply transformation to a set of points of shape (N,3) or (N,2).
+        """
+        return _transform_points(self._M, pts)
+
+    def move(self, obj):
+        """
+        Apply transformation to object or single point.
+
+        Note:
+            When applying a transformation to a mesh, the mesh is modified in place.
+            If you want to keep the original mesh unchanged, use `clone()` method.
+        """
+        if _is_sequence(obj):
+            if np.ndim(obj) == 2:
+                return self.transform_points(obj)
+            return self.transform_point(obj)
+
+        obj.apply_transform(self)
+        return obj
+
+    def reset(self) -> Self:
+        """Reset transformation."""
+        self._M = np.eye(4)
+        return self
+
+    def is_identity(self, tol=None) -> bool:
+        """
+        Check if the transformation is the identity.
+
+        Arguments:
+            tol : (float)
+                if given, compare with this absolute tolerance
+                instead of requiring an exact match.
+        """
+        if tol is None:
+            return np.array_equal(self._M.ravel(), _IDENTITY16)
+        return np.allclose(self._M.ravel(), _IDENTITY16, rtol=0, atol=tol)
+
+    def invert(self) -> Self:
+        """Invert the transformation. Acts in-place."""
+        self._M = np.linalg.inv(self._M)
+        self.inverse_flag = not self.inverse_flag
+        return self
+
+    def compute_inverse(self) -> "LinearTransformNP":
+        """Compute the inverse."""
+        t = self.clone()
+        t.invert()
+        return t
+
+    def transpose(self) -> Self:
+        """Transpose the transformation. Acts in-place."""
+        self._M = self._M.T.copy()
+        return self
+
+    def copy(self) -> "LinearTransformNP":
+        """Return a copy of the transformation. Alias of `clone()`."""
+        return self.clone()
+
+    def clone(self) -> "LinearTransformNP":
+        """Clone transformation to make an exact copy."""
+        return LinearTransformNP(self)
+
+    def concatenate(self, T, pre_multiply=False) -> Self:
+        """
+        Post-multiply (by default) 2 transfomations.
+        T can also be a 4x4 matrix or 3x3 matrix.
+        """
+        M = _as_matrix(T)
+        if pre_multiply:
+            self._M = self._M @ M
+        else:
+            self._M = M @ self._M
+        return self
+
+    def __mul__(self, A):
+        """Pre-multiply 2 transfomations."""
+        return self.concatenate(A, pre_multiply=True)
+
+    def translate(self, p) -> Self:
+        """Translate, same as `shift`."""
+        if len(p) == 2:
+            p = [p[0], p[1], 0]
+        self._M[:3] += np.outer(p, self._M[3])
+        return self
+
+    def shift(self, p) -> Self:
+        """Shift, same as `translate`."""
+        return self.translate(p)
+
+    def scale(self, s, origin=True) -> Self:
+        """Scale."""
+        s = tuple(s) if _is_sequence(s) else (s, s, s)
+        if origin is True:
+            center = self._M[:3, 3].copy()
+        elif _is_sequence(origin):
+            center = np.asarray(origin, dtype=float)
+        else:
+            center = np.zeros(3)
+        self._M = _affine_about(np.diag(s), center) @ self._M
+        return self
+
+    def rotate(self, angle, axis=(1, 0, 0), point=(0, 0, 0), rad=False) -> Self:
+        """
+        Rotate around an arbitrary `axis` passing through `point`.
+        """
+        if not angle:
+            return self
+        anglerad = angle if rad else math.radians(angle)
+        ax, ay, az = [float(c) for c in axis]
+        norm = math.sqrt(ax * ax + ay * ay + az * az)
+        R = _rotation_matrix(anglerad, ax / norm, ay / norm, az / norm)
+        self._M = _affine_about(R, np.asarray(point, dtype=float)) @ self._M
+        return self
+
+    def _rotatexyz(self, axe, angle, rad, around):
+        if not angle:
+            return self
+        anglerad = angle if rad else math.radians(angle)
+        R = _rotation_matrix(anglerad, *_AXES[axe])
+        center = np.zeros(3) if around is None else np.asarray(around, dtype=float)
+        self._M = _affine_about(R, center) @ self._M
+        return self
+
+    def rotate_x(self, angle: float, rad=False, around=None) -> Self:
+        """
+        Rotate around x-axis. If angle is in radians set `rad=True`.
+
+        Use `around` to define a pivoting point.
+        """
+        return self._rotatexyz("x", angle, rad, around)
+
+    def rotate_y(self, angle: float, rad=False, around=None) -> Self:
+        """
+        Rotate around y-axis. If angle is in radians set `rad=True`.
+
+        Use `around` to define a pivoting point.
+        """
+        return self._rotatexyz("y", angle, rad, around)
+
+    def rotate_z(self, angle: float, rad=False, around=None) -> Self:
+        """
+        Rotate around z-axis. If angle is in radians set `rad=True`.
+
+        Use `around` to define a pivoting point.
+        """
+        return self._rotatexyz("z", angle, rad, around)
+
+    def set_position(self, p) -> Self:
+        """Set position."""
+        if len(p) == 2:
+            p = [p[0], p[1], 0]
+        return self.translate(np.subtract(p, self._M[:3, 3]))
+
+    def get_scale(self) -> np.ndarray:
+        """Get current scale."""
+        m = self._M.ravel().tolist()
+        s = _scale_from_matrix(m)
+        if s is None:
+            # general matrix (e.g. with shear): singular values, listed in
+            # the same order as vtkTransform.GetScale() which assigns them
+            # to the axes closest to the corresponding singular vectors
+            _, s, vt = np.linalg.svd(self._M[:3, :3])
+            i = int(np.argmax(np.abs(vt[:, 0])))
+            order = [i] + [j for j in range(3) if j != i]
+            if abs(vt[order[1], 1]) < abs(vt[order[2], 1]):
+                order[1], order[2] = order[2], order[1]
+            s = s[order]
+            if _det3(m) < 0:
+                s = -s
+        return s
+
+    @property
+    def orientation(self) -> np.ndarray:
+        """Compute orientation."""
+        return _orientation_from_matrix(self._M.ravel().tolist())
+
+    @property
+    def position(self) -> np.ndarray:
+        """Compute position."""
+        return self._M[:3, 3].copy()
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Get the 4x4 trasformation matrix."""
+        return self._M.copy()
+
+    @matrix.setter
+    def matrix(self, M) -> None:
+        """Set trasformation by assigning a 4x4 or 3x3 numpy matrix."""
+        self._M = _to_matrix_buffer(M).reshape(4, 4).copy()
+
+    @property
+    def matrix3x3(self) -> np.ndarray:
+        """Get the 3x3 trasformation matrix."""
+        return self.matrix[:3, :3]
+
+    def write(self, filename="transform.mat") -> Self:
+        """Save transformation to ASCII file."""
+        import json
+        dictionary = {
+            "name": self.name,
+            "comment": self.comment,
+            "matrix": self._M.astype(float).tolist(),
+        }
+        with open(filename, "w") as outfile:
+            json.dump(dictionary, outfile, sort_keys=True, indent=2)
+        return self
+
+    def reorient(
+        self, initaxis, newaxis, around=(0, 0, 0), rotation=0.0, rad=False, xyplane=True
+    ) -> Self:
+        """
+        Set/Get object orientation.
+
+        Arguments:
+            rotation : (float)
+                rotate object around newaxis.
+            rad : (bool)
+                set to True if angle is expressed in radians.
+            xyplane : (bool)
+                make an extra rotation to keep the object aligned to the xy-plane
+        """
+        newaxis = np.asarray(newaxis, dtype=float) / np.linalg.norm(newaxis)
+        initaxis = np.asarray(initaxis, dtype=float) / np.linalg.norm(initaxis)
+
+        if not np.any(initaxis - newaxis):
+            return self
+
+        if not np.any(initaxis + newaxis):
+            print("Warning: in reorient() initaxis and newaxis are parallel")
+            newaxis += np.array([0.0000001, 0.0000002, 0.0])
+            angleth = np.pi
+        else:
+            angleth = np.arccos(np.dot(initaxis, newaxis))
+        crossvec = np.cross(initaxis, newaxis)
+        crossvec /= np.linalg.norm(crossvec)
+
+        p = np.asarray(around, dtype=float)
+        if rotation:
+            if not rad:
+                rotation = math.radians(rotation)
+            R = _rotation_matrix(rotation, *initaxis.tolist())
+            self._M = _affine_about(R, p) @ self._M
+
+        R = _rotation_matrix(angleth, *crossvec.tolist())
+        self._M = _affine_about(R, p) @ self._M
+
+        if xyplane:
+            nx, ny, nz = newaxis / np.linalg.norm(newaxis)
+            angle = math.radians(-self.orientation[0] * 1.4142)
+            R = _rotation_matrix(angle, nx, ny, nz)
+            self._M = _affine_about(R, p) @ self._M
+        return self
+
+
+def _as_matrix(T) -> np.ndarray:
+    # 4x4 numpy matrix from any input accepted by the linear transformations
+    if T is None:
+        return np.eye(4)
+    if isinstance(T, (LinearTransform, LinearTransformNP)):
+        return T.matrix
+    if isinstance(T, vtki.vtkMatrix4x4):
+        return _get_matrix_buffer(T).reshape(4, 4)
+    if isinstance(T, vtki.vtkLinearTransform):
+        return _get_matrix_buffer(T.GetMatrix()).reshape(4, 4)
+    return _to_matrix_buffer(T).reshape(4, 4).copy()
+
+
 ###################################################
 class NonLinearTransform:
     """Work with non-linear transformations."""
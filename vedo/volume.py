@@ -714,7 +714,7 @@ class Volume(VolumeAlgorithms, VolumeVisual):
             interpolation : (str)
                 one of the following: "nearest", "linear", "cubic"
         """
-        if utils.is_sequence(T):
+        if utils.is_sequence(T) or isinstance(T, transformations.LinearTransformNP):
             T = transformations.LinearTransform(T)
 
         TI = T.compute_inverse()